@@ -9,6 +9,7 @@ import sys
 from typing import List
 
 import anyio
+import orjson
 
 # Rich imports
 from rich import print
@@ -366,8 +367,8 @@ def cli_main():
 
     try:
         if args.all:
-            with open(args.config_file,'r') as f:
-                args.servers = list(json.load(f)['mcpServers'].keys())
+            with open(args.config_file,'rb') as f:
+                args.servers = list(orjson.loads(f.read())['mcpServers'].keys())
         result = anyio.run(run, args.config_file, args.servers, args.command)
         sys.exit(result)
     except Exception as e:
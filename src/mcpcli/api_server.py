@@ -1,16 +1,32 @@
-import json
+import asyncio
+import weakref
+from collections import OrderedDict
 from typing import List, Optional
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+import orjson
 import uvicorn
 
-from mcpcli.chat_api import initialize_servers, chat_completion
+from mcpcli.chat_api import initialize_servers, invalidate_tool_cache, stream_chat_completion
+from mcpcli.llm_client import close_http_client
 
 # Global variable to store server streams
 server_streams = []
 context_managers = []
 
+# Conversation history per client session, so clients only send the new turn.
+# Least recently used sessions are dropped beyond MAX_SESSIONS.
+sessions: "OrderedDict[str, List[dict]]" = OrderedDict()
+session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Number of user turns kept per session before the oldest are dropped
+MAX_SESSION_TURNS = 50
+
+# Number of sessions kept before the least recently used are dropped
+MAX_SESSIONS = 256
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
@@ -19,8 +35,8 @@ async def lifespan(app: FastAPI):
     # Startup
     config_file = r"server_config.json"
     try:
-        with open(config_file, 'r') as f:
-            servers = list(json.load(f)['mcpServers'].keys())
+        with open(config_file, 'rb') as f:
+            servers = list(orjson.loads(f.read())['mcpServers'].keys())
         
         # Initialize server connections
         streams, managers = await initialize_servers(config_file, servers)
@@ -40,46 +56,89 @@ async def lifespan(app: FastAPI):
                 await cm.__aexit__(None, None, None)
             except:
                 pass
+        sessions.clear()
+        invalidate_tool_cache()
+        await close_http_client()
 
 # Initialize FastAPI with lifespan
 app = FastAPI(title="MCP Chat API", lifespan=lifespan)
 
-class ChatMessage(BaseModel):
-    role: str
-    content: str
-
 class ChatRequest(BaseModel):
-    messages: List[ChatMessage]
-    add_system_prompt: Optional[bool] = False
+    session_id: str
+    user_message: str
     provider: Optional[str] = None
     model: Optional[str] = None
 
+def trim_history(history: List[dict], max_turns: int = MAX_SESSION_TURNS) -> List[dict]:
+    """Drop the oldest turns beyond max_turns, keeping the system prompt."""
+    system = history[:1] if history and history[0]["role"] == "system" else []
+    user_turns = [i for i, msg in enumerate(history) if msg["role"] == "user"]
+    if len(user_turns) <= max_turns:
+        return history
+
+    # Cut at a user message so tool calls stay paired with their results
+    return system + history[user_turns[-max_turns]:]
+
+def store_session(session_id: str, history: List[dict]):
+    """Save a session's history, evicting the least recently used sessions."""
+    sessions[session_id] = trim_history(history)
+    sessions.move_to_end(session_id)
+    while len(sessions) > MAX_SESSIONS:
+        sessions.popitem(last=False)
+
+def get_session_lock(session_id: str) -> asyncio.Lock:
+    """Return the lock serializing changes to a session, creating it if needed."""
+    lock = session_locks.get(session_id)
+    if lock is None:
+        lock = session_locks[session_id] = asyncio.Lock()
+    return lock
+
 @app.post("/chat")
 async def chat(request: ChatRequest):
-    """Handle chat completion requests."""
+    """Handle chat completion requests, streaming the response as server-sent events."""
     if not server_streams:
         raise HTTPException(status_code=503, detail="Server connections not initialized")
 
-    try:
-        # Convert Pydantic models to dictionaries
-        messages = [msg.model_dump() for msg in request.messages]
-        
-        # Process chat completion
-        chat_history = await chat_completion(
-            server_streams=server_streams,
-            messages=messages,
-            add_system_prompt=request.add_system_prompt,
-            provider=request.provider,
-            model=request.model
-        )
-        
-        if not chat_history:
-            raise HTTPException(status_code=500, detail="Chat completion failed")
-        
-        return {"messages": chat_history}
-    
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    session_id = request.session_id
+    user_message = {"role": "user", "content": request.user_message}
+
+    # Turns on the same session run one after another; the request holds the lock
+    # object so it outlives its entry in the weak mapping for the whole turn
+    lock = get_session_lock(session_id)
+
+    async def event_stream():
+        # Each event is a `{"delta": ...}` token, the final assistant `{"message": ...}`,
+        # or an `{"error": ...}` if the completion failed mid-stream
+        async with lock:
+            history = sessions.get(session_id)
+            if history is None:
+                # New session, start from the system prompt
+                messages, add_system_prompt = [user_message], True
+            else:
+                # Run the turn on a copy, it is only stored once it completes so a
+                # failed or abandoned turn leaves the session untouched
+                messages, add_system_prompt = history + [user_message], False
+
+            async for event in stream_chat_completion(
+                server_streams=server_streams,
+                messages=messages,
+                add_system_prompt=add_system_prompt,
+                provider=request.provider,
+                model=request.model
+            ):
+                if "messages" in event:
+                    store_session(session_id, event["messages"])
+                    event = {"message": event["messages"][-1]}
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@app.delete("/chat/{session_id}")
+async def delete_session(session_id: str):
+    """Forget a session's history."""
+    # Wait for any turn in flight, otherwise it would store the session again
+    async with get_session_lock(session_id):
+        return {"deleted": sessions.pop(session_id, None) is not None}
 
 def start_server(host: str = "0.0.0.0", port: int = 8132):
     """Start the FastAPI server."""
@@ -1,13 +1,15 @@
 import os
-import json
 import asyncio
 import contextlib
-from typing import List, Optional
+import weakref
+import orjson
+from typing import AsyncIterator, List, Optional, Tuple
+from anyio.streams.memory import MemoryObjectSendStream
 from mcpcli.config import load_config
 from mcpcli.transport.stdio.stdio_client import stdio_client
 from mcpcli.messages.send_initialize_message import send_initialize
 from mcpcli.llm_client import LLMClient
-from mcpcli.tools_handler import convert_to_openai_tools, fetch_tools, handle_tool_call
+from mcpcli.tools_handler import convert_to_openai_tools, fetch_tools, handle_tool_calls
 from mcpcli.chat_handler import generate_system_prompt
 
 ANSI_RED = "\033[91m"
@@ -18,6 +20,12 @@ ANSI_CYAN = "\033[96m"
 ANSI_RESET = "\033[0m"
 ANSI_BOLD = "\033[1m"
 
+# Tools and their OpenAI tool schema per server connection, keyed on its write stream.
+# A server's tool list is treated as fixed for the life of its connection.
+_TOOLS_CACHE: "weakref.WeakKeyDictionary[MemoryObjectSendStream, Tuple[List[dict], List[dict]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 async def initialize_servers(config_path: str, server_names: List[str]) -> tuple:
     """Initialize connections to all servers and return the stream pairs."""
@@ -31,16 +39,50 @@ async def initialize_servers(config_path: str, server_names: List[str]) -> tuple
         context_managers.append(cm)
         server_streams.append((read_stream, write_stream))
 
-        init_result = await send_initialize(read_stream, write_stream)
+    # Handshake with all servers concurrently (send_initialize bounds its own wait).
+    # The clients themselves are entered above, in this task, because their task
+    # groups must be exited from it too.
+    init_results = await asyncio.gather(
+        *(send_initialize(read_stream, write_stream) for read_stream, write_stream in server_streams)
+    )
+    for server_name, init_result in zip(server_names, init_results):
         if not init_result:
             print(f"{ANSI_RED}Server initialization failed for {server_name}{ANSI_RESET}")
             return []
 
+    # Warm the tool cache so the first request doesn't pay for discovery
+    await load_tools(server_streams)
+
     return server_streams, context_managers
 
 
+async def load_tools(server_streams: List[tuple]) -> Tuple[List[dict], List[dict]]:
+    """Return the tools and OpenAI tool schema for the given servers."""
+    missing = [streams for streams in server_streams if streams[1] not in _TOOLS_CACHE]
+    results = await asyncio.gather(
+        *(fetch_tools(read_stream, write_stream) for read_stream, write_stream in missing)
+    )
+    for (_, write_stream), server_tools in zip(missing, results):
+        # Failed fetches aren't cached, so the next request retries them
+        if server_tools is not None:
+            _TOOLS_CACHE[write_stream] = (server_tools, convert_to_openai_tools(server_tools))
+
+    tools, openai_tools = [], []
+    for _, write_stream in server_streams:
+        server_tools, server_openai_tools = _TOOLS_CACHE.get(write_stream, ([], []))
+        tools.extend(server_tools)
+        openai_tools.extend(server_openai_tools)
+    return tools, openai_tools
+
+
+def invalidate_tool_cache() -> None:
+    """Forget cached tools so the next request re-discovers them."""
+    _TOOLS_CACHE.clear()
+
+
 async def close_servers(context_managers: List):
     """Properly close all server connections."""
+    invalidate_tool_cache()
     for cm in context_managers:
             with asyncio.move_on_after(1):  # wait up to 1 second
                 await cm.__aexit__()
@@ -50,72 +92,125 @@ async def process_conversation(
         client: LLMClient,
         conversation_history: List[dict],
         openai_tools: List[dict],
-        server_streams: List[tuple]
-) -> None:
-    """Process the conversation loop, handling tool calls and responses."""
-    while True:
-        completion = client.create_completion(
+        server_streams: List[tuple],
+        max_iterations: int = 16
+) -> AsyncIterator[str]:
+    """Process the conversation loop, yielding response tokens as they stream in."""
+    streamed_text = False
+    for _ in range(max_iterations):
+        response_parts = []
+        tool_calls = []
+        async for chunk in client.stream_completion(
             messages=conversation_history,
             tools=openai_tools,
-        )
+        ):
+            if chunk["delta"]:
+                if not response_parts and streamed_text:
+                    # Keep this round's text apart from the previous round's
+                    yield "\n\n"
+                response_parts.append(chunk["delta"])
+                yield chunk["delta"]
+            tool_calls = chunk.get("tool_calls") or tool_calls
 
-        response_content = completion.get("response", "No response")
-        tool_calls = completion.get("tool_calls", [])
+        response_content = "".join(response_parts)
+        streamed_text = streamed_text or bool(response_content)
 
         if tool_calls:
+            # Keep text sent alongside tool calls so the next round builds on it
+            if response_content:
+                conversation_history.append({"role": "assistant", "content": response_content})
             for tool_call in tool_calls:
                 print(f"{ANSI_CYAN}Tool call: {tool_call}{ANSI_RESET}")
-                await handle_tool_call(tool_call, conversation_history, server_streams)
+            await handle_tool_calls(tool_calls, conversation_history, server_streams)
             continue
 
+        if not response_content:
+            # Stream the placeholder too, so clients show what the history stores
+            response_content = "No response"
+            if streamed_text:
+                yield "\n\n"
+            yield response_content
         conversation_history.append({"role": "assistant", "content": response_content})
         break
+    else:
+        # Ran out of rounds; the last round's text is already in the history
+        stop_message = f"Stopped after {max_iterations} rounds of tool calls."
+        print(f"{ANSI_RED}{stop_message}{ANSI_RESET}")
+        if streamed_text:
+            yield "\n\n"
+        yield stop_message
+        conversation_history.append({"role": "assistant", "content": stop_message})
 
 
-async def chat_completion(
+async def stream_chat_completion(
         server_streams: List[tuple],
         messages: Optional[List[dict]] = None,
         add_system_prompt: bool = False,
         provider: str = None,
         model: str = None
-) -> List[dict]:
-    """Handle a chat completion request with the given messages."""
+) -> AsyncIterator[dict]:
+    """
+    Stream a chat completion request with the given messages.
+
+    Yields ``{"delta": ...}`` events for each response token, followed by a final
+    ``{"messages": ...}`` event with the full conversation history, or a single
+    ``{"error": ...}`` event if the completion fails.
+    """
     try:
         provider = provider or os.getenv("LLM_PROVIDER", "groq/llama-3.1-8b-instant")
         model = model or os.getenv("LLM_MODEL", provider.split("/")[-1])
 
         # Fetch and prepare tools
-        tools = []
-        for read_stream, write_stream in server_streams:
-            tools.extend(await fetch_tools(read_stream, write_stream))
-
-        openai_tools = convert_to_openai_tools(tools)
+        tools, openai_tools = await load_tools(server_streams)
         client = LLMClient(provider=provider, model=model)
 
         # Initialize or update conversation history
         if messages is None or add_system_prompt:
-            system_prompt = generate_system_prompt(tools)
-            system_message = [{"role": "system", "content": system_prompt}]
+            system_message = [{"role": "system", "content": generate_system_prompt(tools)}]
             conversation_history = system_message + (messages or [])
         else:
             conversation_history = messages
 
         # Process the conversation
-        await process_conversation(
+        async for delta in process_conversation(
             client, conversation_history, openai_tools, server_streams
-        )
-        return conversation_history
+        ):
+            yield {"delta": delta}
+        yield {"messages": conversation_history}
 
     except Exception as e:
         print(f"{ANSI_RED}Error in chat completion: {e}{ANSI_RESET}")
-        return None
+        yield {"error": str(e)}
+
+
+async def chat_completion(
+        server_streams: List[tuple],
+        messages: Optional[List[dict]] = None,
+        add_system_prompt: bool = False,
+        provider: str = None,
+        model: str = None
+) -> List[dict]:
+    """Handle a chat completion request with the given messages."""
+    conversation_history = None
+    async for event in stream_chat_completion(
+        server_streams, messages, add_system_prompt, provider, model
+    ):
+        if "messages" in event:
+            conversation_history = event["messages"]
+    return conversation_history
+
+
+async def get_input(prompt: str) -> str:
+    """Read a line of input without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, input, prompt)
 
 
 async def main():
     """Example usage of the chat API."""
     config_file = r"G:\Projects\mcp-via-litellm\server_config.json"
-    with open(config_file, 'r') as f:
-        servers = list(json.load(f)['mcpServers'].keys())
+    with open(config_file, 'rb') as f:
+        servers = list(orjson.loads(f.read())['mcpServers'].keys())
 
     server_streams = []
     context_managers = []
@@ -124,7 +219,7 @@ async def main():
         server_streams, context_managers = await initialize_servers(config_file, servers)
 
         # Initial message
-        user_message = input(f"{ANSI_YELLOW}Enter your message: {ANSI_RESET}")
+        user_message = await get_input(f"{ANSI_YELLOW}Enter your message: {ANSI_RESET}")
         if user_message.lower() == 'exit':
             # Okay, nothing works ... let's try the old way
             print('Forcing my way out!')
@@ -141,12 +236,13 @@ async def main():
 
         # Continue chat
         while True:
-            user_message = input(f"{ANSI_YELLOW}Enter your message (or 'exit' to quit): {ANSI_RESET}")
+            user_message = await get_input(f"{ANSI_YELLOW}Enter your message (or 'exit' to quit): {ANSI_RESET}")
             if user_message.lower() == 'exit':
                 print(f"{ANSI_GREEN}Chat session ended.{ANSI_RESET}")
                 break
             elif user_message.lower() == 'history':
-                print(f"{ANSI_CYAN}{chat_history}{ANSI_RESET}")
+                # Long histories can be slow to write to the terminal
+                await asyncio.to_thread(print, f"{ANSI_CYAN}{chat_history}{ANSI_RESET}")
                 continue
 
             # Properly update chat history
@@ -1,53 +1,104 @@
 import sys
 import json
 import asyncio
+import uuid
 import requests
-from typing import List, Dict
+from typing import Dict, List, Optional
 from rich import print
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.prompt import Prompt
 
 SERVER_URL = "http://localhost:8132"
 
-def send_chat_request(messages: List[Dict], add_system_prompt: bool = False) -> List[Dict]:
-    """Send a chat request to the server and return the response."""
+# Reuse one connection to the server across turns
+_SESSION = requests.Session()
+
+# Parsed Markdown per history message, keyed by id() of the message dict
+_MARKDOWN_CACHE: Dict[int, Markdown] = {}
+
+def _assistant_panel(ai_message) -> Panel:
+    """Build the panel used to display an assistant reply (text or pre-parsed Markdown)."""
+    return Panel(
+        ai_message if isinstance(ai_message, Markdown) else Markdown(ai_message),
+        title="[bold blue]Assistant[/bold blue]",
+        style="bold white"
+    )
+
+def _print_history(conversation_history: List[Dict]):
+    """Print the conversation so far, parsing each message's Markdown only once."""
+    for message in conversation_history:
+        if message["role"] == "user":
+            print(Panel(message["content"], style="bold yellow", title="You"))
+            continue
+        markdown = _MARKDOWN_CACHE.get(id(message))
+        if markdown is None:
+            markdown = _MARKDOWN_CACHE[id(message)] = Markdown(message.get("content") or "")
+        print(_assistant_panel(markdown))
+
+def send_chat_request(session_id: str, user_message: str) -> Optional[Dict]:
+    """Send a chat turn to the server, rendering the streamed reply, and return the assistant message."""
     try:
-        # Ensure messages are in the correct format
-        formatted_messages = [
-            {
-                "role": msg.get("role", "user"),
-                "content": msg.get("content", "")
-            }
-            for msg in messages
-        ]
-        
+        # The server keeps the session's history, so only the new turn is sent
         payload = {
-            "messages": formatted_messages,
-            "add_system_prompt": add_system_prompt,
+            "session_id": session_id,
+            "user_message": user_message,
             "provider": "openai/gpt-3.5-turbo",  # You can make these configurable
             "model": None
         }
         
-        response = requests.post(
+        response = _SESSION.post(
             f"{SERVER_URL}/chat",
-            json=payload
+            json=payload,
+            stream=True
         )
         response.raise_for_status()
-        return response.json()["messages"]
+
+        # Render tokens as they arrive over server-sent events. The panel is rebuilt
+        # on each refresh rather than on each token, so Markdown is re-parsed at most
+        # refresh_per_second times however fast tokens arrive.
+        ai_parts = []
+        assistant_message = None
+        with Live(
+            get_renderable=lambda: _assistant_panel("".join(ai_parts)),
+            refresh_per_second=10,
+            auto_refresh=True
+        ):
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                event = json.loads(line[len("data:"):])
+                if "delta" in event:
+                    ai_parts.append(event["delta"])
+                elif "message" in event:
+                    # Record the reply as it was shown, including text from
+                    # rounds that preceded tool calls
+                    assistant_message = {**event["message"], "content": "".join(ai_parts)}
+                elif "error" in event:
+                    print(f"[red]Server error:[/red] {event['error']}")
+        return assistant_message
     except requests.exceptions.RequestException as e:
         print(f"[red]Error communicating with server:[/red] {str(e)}")
         if hasattr(e.response, 'text'):
             print(f"[red]Response details:[/red] {e.response.text}")
         return None
 
+def delete_session(session_id: str):
+    """Ask the server to forget a session's history."""
+    try:
+        _SESSION.delete(f"{SERVER_URL}/chat/{session_id}").raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"[red]Error communicating with server:[/red] {str(e)}")
+
 def main():
     print(Panel(
-        Markdown("# Welcome to MCP Chat Client\n\nType 'exit' to quit, 'clear' to clear history"),
+        Markdown("# Welcome to MCP Chat Client\n\nType 'exit' to quit, 'history' to show the conversation, 'clear' to clear history"),
         style="bold blue"
     ))
 
-    # Initialize conversation history
+    # Initialize conversation history; the server keeps its own copy per session
+    session_id = str(uuid.uuid4())
     conversation_history = []
     
     try:
@@ -57,40 +108,28 @@ def main():
             
             # Handle commands
             if user_message.lower() == "exit":
+                delete_session(session_id)
                 print("[bold red]Goodbye![/bold red]")
                 break
             elif user_message.lower() == "clear":
+                delete_session(session_id)
+                session_id = str(uuid.uuid4())
                 conversation_history = []
+                _MARKDOWN_CACHE.clear()
                 print("[bold green]History cleared![/bold green]")
                 continue
+            elif user_message.lower() == "history":
+                _print_history(conversation_history)
+                continue
 
-            # Add user message to history
-            conversation_history.append({"role": "user", "content": user_message})
-            
             # Send request to server
-            add_system_prompt = len(conversation_history) == 1  # Only for first message
-            updated_history = send_chat_request(
-                conversation_history[-1:] if not add_system_prompt else conversation_history,
-                add_system_prompt
-            )
+            assistant_message = send_chat_request(session_id, user_message)
             
-            if updated_history:
-                # Update conversation history while preserving the structure
-                if add_system_prompt:
-                    conversation_history = updated_history
-                else:
-                    conversation_history.extend(updated_history[len(conversation_history):])
-                    
-                # Display AI response
-                ai_message = updated_history[-1]["content"]
-                print(Panel(
-                    Markdown(ai_message),
-                    title="[bold blue]Assistant[/bold blue]",
-                    style="bold white"
-                ))
+            if assistant_message:
+                conversation_history.append({"role": "user", "content": user_message})
+                conversation_history.append(assistant_message)
             else:
                 print("[red]Failed to get response from server[/red]")
-                conversation_history.pop()  # Remove failed message from history
 
     except KeyboardInterrupt:
         print("\n[bold red]Chat session terminated.[/bold red]")
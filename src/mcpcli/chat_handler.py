@@ -1,6 +1,9 @@
 # chat_handler.py
-import json
 import asyncio
+import logging
+from collections import OrderedDict
+
+import orjson
 
 from rich import print
 from rich.markdown import Markdown
@@ -9,7 +12,7 @@ from rich.prompt import Prompt
 
 from mcpcli.llm_client import LLMClient
 from mcpcli.system_prompt_generator import SystemPromptGenerator
-from mcpcli.tools_handler import convert_to_openai_tools, fetch_tools, handle_tool_call
+from mcpcli.tools_handler import convert_to_openai_tools, fetch_tools, handle_tool_calls
 
 async def get_input(prompt: str):
     """Get input asynchronously."""
@@ -59,10 +62,10 @@ async def handle_chat_mode(server_streams, provider="openai", model="gpt-4o-mini
 
 
 async def process_conversation(
-    client, conversation_history, openai_tools, server_streams
+    client, conversation_history, openai_tools, server_streams, max_iterations=16
 ):
     """Process the conversation loop, handling tool calls and responses."""
-    while True:
+    for _ in range(max_iterations):
         completion = client.create_completion(
             messages=conversation_history,
             tools=openai_tools,
@@ -72,6 +75,13 @@ async def process_conversation(
         tool_calls = completion.get("tool_calls", [])
 
         if tool_calls:
+            # As in chat_api.process_conversation
+            if response_content:
+                print(
+                    Panel(Markdown(response_content), style="bold blue", title="Assistant")
+                )
+                conversation_history.append({"role": "assistant", "content": response_content})
+
             for tool_call in tool_calls:
                 # Extract tool_name and raw_arguments as before
                 if hasattr(tool_call, "function"):
@@ -85,16 +95,20 @@ async def process_conversation(
                     tool_name = "unknown tool"
                     raw_arguments = {}
 
-                # If raw_arguments is a string, try to parse it as JSON
-                if isinstance(raw_arguments, str):
-                    try:
-                        raw_arguments = json.loads(raw_arguments)
-                    except json.JSONDecodeError:
-                        # If it's not valid JSON, just display as is
-                        pass
-
-                # Now raw_arguments should be a dict or something we can pretty-print as JSON
-                tool_args_str = json.dumps(raw_arguments, indent=2)
+                # Show string arguments as the model sent them; only pay for a
+                # parse and pretty-print round-trip when debugging
+                if isinstance(raw_arguments, str) and not logging.getLogger().isEnabledFor(logging.DEBUG):
+                    tool_args_str = raw_arguments
+                else:
+                    if isinstance(raw_arguments, str):
+                        try:
+                            raw_arguments = orjson.loads(raw_arguments)
+                        except orjson.JSONDecodeError:
+                            # If it's not valid JSON, just display as is
+                            pass
+                    tool_args_str = orjson.dumps(
+                        raw_arguments, option=orjson.OPT_INDENT_2
+                    ).decode()
 
                 tool_md = f"**Tool Call:** {tool_name}\n\n```json\n{tool_args_str}\n```"
                 print(
@@ -103,7 +117,7 @@ async def process_conversation(
                     )
                 )
 
-                await handle_tool_call(tool_call, conversation_history, server_streams)
+            await handle_tool_calls(tool_calls, conversation_history, server_streams)
             continue
 
         # Assistant panel with Markdown
@@ -113,19 +127,15 @@ async def process_conversation(
         )
         conversation_history.append({"role": "assistant", "content": response_content})
         break
+    else:
+        # As in chat_api.process_conversation
+        stop_message = f"Stopped after {max_iterations} rounds of tool calls."
+        print(f"[red]{stop_message}[/red]")
+        conversation_history.append({"role": "assistant", "content": stop_message})
 
 
-def generate_system_prompt(tools):
-    """
-    Generate a concise system prompt for the assistant.
-
-    This prompt is internal and not displayed to the user.
-    """
-    prompt_generator = SystemPromptGenerator()
-    tools_json = {"tools": tools}
-
-    system_prompt = prompt_generator.generate_prompt(tools_json)
-    system_prompt += """
+# Static guidance appended to every generated system prompt
+_GUIDELINES = """
 
 **GENERAL GUIDELINES:**
 
@@ -177,4 +187,31 @@ EXAMPLES OF ASSUMPTIONS:
 - Default sorting (e.g., descending order) if not specified.
 - Assume basic user intentions, such as fetching top results by a common metric.
 """
+
+
+# Generated system prompts keyed by the canonical JSON of their tools, oldest first
+_PROMPT_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_PROMPT_CACHE_SIZE = 16
+
+
+def generate_system_prompt(tools):
+    """
+    Generate a concise system prompt for the assistant.
+
+    This prompt is internal and not displayed to the user. Prompts are memoized on
+    the tools' content, so repeated calls with an unchanged tool set are cheap.
+    """
+    key = orjson.dumps(tools, option=orjson.OPT_SORT_KEYS)
+    system_prompt = _PROMPT_CACHE.get(key)
+    if system_prompt is not None:
+        _PROMPT_CACHE.move_to_end(key)
+        return system_prompt
+
+    prompt_generator = SystemPromptGenerator()
+    tools_json = {"tools": tools}
+
+    system_prompt = "".join((prompt_generator.generate_prompt(tools_json), _GUIDELINES))
+    _PROMPT_CACHE[key] = system_prompt
+    if len(_PROMPT_CACHE) > _PROMPT_CACHE_SIZE:
+        _PROMPT_CACHE.popitem(last=False)
     return system_prompt
@@ -2,6 +2,8 @@
 import json
 import logging
 
+import orjson
+
 from mcpcli.transport.stdio.stdio_server_parameters import StdioServerParameters
 
 
@@ -12,8 +14,8 @@ async def load_config(config_path: str, server_name: str) -> StdioServerParamete
         logging.debug(f"Loading config from {config_path}")
 
         # Read the configuration file
-        with open(config_path, "r") as config_file:
-            config = json.load(config_file)
+        with open(config_path, "rb") as config_file:
+            config = orjson.loads(config_file.read())
 
         # Retrieve the server configuration
         server_config = config.get("mcpServers", {}).get(server_name)
@@ -1,9 +1,11 @@
+import asyncio
 import logging
 import os
 import uuid
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 import json
 
+import httpx
 import ollama
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -12,6 +14,31 @@ import litellm
 # Load environment variables
 load_dotenv()
 
+# Shared HTTP client so LLM round-trips reuse connections instead of handshaking each time
+_GLOBAL_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it and handing it to LiteLLM on first use."""
+    global _GLOBAL_CLIENT
+    if _GLOBAL_CLIENT is None or _GLOBAL_CLIENT.is_closed:
+        _GLOBAL_CLIENT = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        litellm.aclient_session = _GLOBAL_CLIENT
+    return _GLOBAL_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared async HTTP client, if one was created."""
+    global _GLOBAL_CLIENT
+    if _GLOBAL_CLIENT is not None:
+        await _GLOBAL_CLIENT.aclose()
+        _GLOBAL_CLIENT = None
+        litellm.aclient_session = None
+
 
 class LLMClient:
     def __init__(self, provider="openai", model="gpt-4o-mini", api_key=None):
@@ -56,6 +83,73 @@ class LLMClient:
             # unsupported providers
             raise ValueError(f"Unsupported provider: {self.provider}")
 
+    async def stream_completion(
+        self, messages: List[Dict], tools: List = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a chat completion, yielding chunks as they arrive.
+
+        Each chunk is a dict with a ``delta`` string of new content. The last chunk
+        also carries the accumulated ``tool_calls``. Providers without a streaming
+        path yield the whole completion as a single chunk.
+        """
+        if '/' in self.provider:
+            async for chunk in self._lite_llm_stream(messages, tools, self.provider):
+                yield chunk
+            return
+
+        # fall back to a blocking completion, run off the event loop
+        completion = await asyncio.to_thread(self.create_completion, messages, tools)
+        yield {
+            "delta": completion.get("response") or "",
+            "tool_calls": completion.get("tool_calls") or [],
+        }
+
+    @staticmethod
+    async def _lite_llm_stream(
+        messages: List[Dict], tools: List, provider: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Handle streaming LiteLLM chat completions."""
+        try:
+            get_http_client()
+            response = await litellm.acompletion(
+                model=provider,
+                messages=messages,
+                tools=tools or [],
+                stream=True,
+            )
+
+            # tool calls arrive as fragments keyed by index, stitch them together
+            tool_calls: Dict[int, Dict[str, Any]] = {}
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+
+                for fragment in getattr(delta, "tool_calls", None) or []:
+                    index = fragment.index if fragment.index is not None else 0
+                    call = tool_calls.setdefault(
+                        index,
+                        {"id": None, "type": "function", "function": {"name": "", "arguments": ""}},
+                    )
+                    if fragment.id:
+                        call["id"] = fragment.id
+                    if fragment.function:
+                        call["function"]["name"] += fragment.function.name or ""
+                        call["function"]["arguments"] += fragment.function.arguments or ""
+
+                if delta.content:
+                    yield {"delta": delta.content, "tool_calls": []}
+
+            yield {
+                "delta": "",
+                "tool_calls": [tool_calls[index] for index in sorted(tool_calls)],
+            }
+        except Exception as e:
+            # error
+            logging.error(f"LiteLLM API Error: {str(e)}")
+            raise ValueError(f"LiteLLM API Error: {str(e)}")
+
     @staticmethod
     def _lite_llm_completion(messages: List[Dict], tools: List, provider: str) -> Dict[str, Any]:
         """Handle LiteLLM chat completions."""
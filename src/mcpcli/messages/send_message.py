@@ -1,9 +1,26 @@
 # messages/send_message.py
 import logging
+import weakref
+
 import anyio
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from mcpcli.messages.message_types.json_rpc_message import JSONRPCMessage
 
+# Responses are read off the stream in arrival order, so only one request may be
+# in flight per server connection at a time
+_STREAM_LOCKS: "weakref.WeakKeyDictionary[MemoryObjectSendStream, anyio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _stream_lock(write_stream: MemoryObjectSendStream) -> anyio.Lock:
+    """Return the lock serializing requests on a server connection."""
+    lock = _STREAM_LOCKS.get(write_stream)
+    if lock is None:
+        lock = _STREAM_LOCKS[write_stream] = anyio.Lock()
+    return lock
+
+
 async def send_message(
     read_stream: MemoryObjectReceiveStream,
     write_stream: MemoryObjectSendStream,
@@ -28,31 +45,38 @@ async def send_message(
         TimeoutError: If no response is received within the timeout.
         Exception: If an unexpected error occurs.
     """
-    for attempt in range(1, retries + 1):
-        try:
-            logging.debug(f"Attempt {attempt}/{retries}: Sending message: {message}")
-            await write_stream.send(message)
-
-            with anyio.fail_after(timeout):
-                async for response in read_stream:
-                    if not isinstance(response, Exception):
+    async with _stream_lock(write_stream):
+        for attempt in range(1, retries + 1):
+            try:
+                logging.debug(f"Attempt {attempt}/{retries}: Sending message: {message}")
+                await write_stream.send(message)
+
+                with anyio.fail_after(timeout):
+                    async for response in read_stream:
+                        if isinstance(response, Exception):
+                            logging.error(f"Server error: {response}")
+                            raise response
+
+                        # Skip notifications and late responses to earlier requests
+                        # that were cancelled or timed out
+                        if response.id != message.id:
+                            logging.debug(f"Skipping unrelated message: {response.model_dump()}")
+                            continue
+
                         logging.debug(f"Received response: {response.model_dump()}")
                         return response.model_dump()
-                    else:
-                        logging.error(f"Server error: {response}")
-                        raise response
-
-        except TimeoutError:
-            logging.error(
-                f"Timeout waiting for response to message '{message.method}' (Attempt {attempt}/{retries})"
-            )
-            if attempt == retries:
-                raise
-        except Exception as e:
-            logging.error(
-                f"Unexpected error during '{message.method}' request: {e} (Attempt {attempt}/{retries})"
-            )
-            if attempt == retries:
-                raise
-
-        await anyio.sleep(2)
+
+            except TimeoutError:
+                logging.error(
+                    f"Timeout waiting for response to message '{message.method}' (Attempt {attempt}/{retries})"
+                )
+                if attempt == retries:
+                    raise
+            except Exception as e:
+                logging.error(
+                    f"Unexpected error during '{message.method}' request: {e} (Attempt {attempt}/{retries})"
+                )
+                if attempt == retries:
+                    raise
+
+            await anyio.sleep(2)
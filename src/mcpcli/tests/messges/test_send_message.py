@@ -0,0 +1,70 @@
+# tests/test_send_message.py
+import anyio
+import pytest
+from mcpcli.messages.send_message import send_message
+from mcpcli.messages.message_types.json_rpc_message import JSONRPCMessage
+
+
+async def reversing_server(requests, responses):
+    """Answer pending requests in reverse order, as an out-of-order server could."""
+    async with requests, responses:
+        async for request in requests:
+            pending = [request]
+            # pick up any request sent while this one is outstanding
+            with anyio.move_on_after(0.1):
+                pending.append(await requests.receive())
+            for message in reversed(pending):
+                await responses.send(JSONRPCMessage(id=message.id, result={"echo": message.id}))
+
+
+@pytest.mark.asyncio
+async def test_send_message_concurrent_requests_get_own_response():
+    write_stream, server_requests = anyio.create_memory_object_stream(0)
+    server_responses, read_stream = anyio.create_memory_object_stream(0)
+    results = {}
+
+    async def request(message_id):
+        message = JSONRPCMessage(id=message_id, method="ping")
+        results[message_id] = await send_message(read_stream, write_stream, message)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(reversing_server, server_requests, server_responses)
+        async with anyio.create_task_group() as requests_tg:
+            requests_tg.start_soon(request, "req-1")
+            requests_tg.start_soon(request, "req-2")
+        await write_stream.aclose()
+
+    # Each caller gets the response to its own request
+    assert results["req-1"]["result"] == {"echo": "req-1"}
+    assert results["req-2"]["result"] == {"echo": "req-2"}
+
+
+async def delayed_server(requests, responses):
+    """Answer each request after a delay, even if its caller has given up."""
+    async def respond(request):
+        await anyio.sleep(0.1)
+        await responses.send(JSONRPCMessage(id=request.id, result={"echo": request.id}))
+
+    async with requests, responses:
+        async with anyio.create_task_group() as tg:
+            async for request in requests:
+                tg.start_soon(respond, request)
+
+
+@pytest.mark.asyncio
+async def test_send_message_skips_late_response_to_cancelled_request():
+    write_stream, server_requests = anyio.create_memory_object_stream(0)
+    server_responses, read_stream = anyio.create_memory_object_stream(0)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(delayed_server, server_requests, server_responses)
+
+        # Give up on the first request before the server answers it
+        with anyio.move_on_after(0.05):
+            await send_message(read_stream, write_stream, JSONRPCMessage(id="req-1", method="ping"))
+
+        result = await send_message(read_stream, write_stream, JSONRPCMessage(id="req-2", method="ping"))
+        tg.cancel_scope.cancel()
+
+    assert result["id"] == "req-2"
+    assert result["result"] == {"echo": "req-2"}
@@ -0,0 +1,32 @@
+# tests/test_tools_handler.py
+import anyio
+import pytest
+from unittest.mock import patch
+from mcpcli.tools_handler import handle_tool_calls
+
+
+def make_tool_call(call_id, name):
+    return {"id": call_id, "type": "function", "function": {"name": name, "arguments": "{}"}}
+
+
+@pytest.mark.asyncio
+async def test_handle_tool_calls_appends_in_call_order():
+    finished = []
+
+    async def mock_send_call_tool(tool_name, arguments, read_stream, write_stream):
+        # the first call finishes last
+        await anyio.sleep(0.1 if tool_name == "slow" else 0)
+        finished.append(tool_name)
+        return {"content": [{"type": "text", "text": f"{tool_name} done"}]}
+
+    conversation_history = [{"role": "user", "content": "go"}]
+    tool_calls = [make_tool_call("call-1", "slow"), make_tool_call("call-2", "fast")]
+
+    with patch("mcpcli.tools_handler.send_call_tool", new=mock_send_call_tool):
+        await handle_tool_calls(tool_calls, conversation_history, [(None, None)])
+
+    assert finished == ["fast", "slow"]
+    assert [msg["role"] for msg in conversation_history] == ["user", "assistant", "tool", "assistant", "tool"]
+    assert [msg["tool_call_id"] for msg in conversation_history if msg["role"] == "tool"] == ["call-1", "call-2"]
+    assert conversation_history[2]["content"] == "slow done"
+    assert conversation_history[4]["content"] == "fast done"
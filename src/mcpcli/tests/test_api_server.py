@@ -0,0 +1,97 @@
+# tests/test_api_server.py
+import orjson
+import pytest
+from unittest.mock import patch
+from mcpcli import api_server
+from mcpcli.api_server import ChatRequest, chat, store_session, trim_history
+
+
+@pytest.fixture(autouse=True)
+def clear_sessions():
+    api_server.sessions.clear()
+    yield
+    api_server.sessions.clear()
+
+
+def make_turn(n):
+    return [
+        {"role": "user", "content": f"question {n}"},
+        {"role": "assistant", "content": "", "tool_calls": [{"id": f"call-{n}"}]},
+        {"role": "tool", "tool_call_id": f"call-{n}", "content": "result"},
+        {"role": "assistant", "content": f"answer {n}"},
+    ]
+
+
+def test_trim_history_under_limit_is_unchanged():
+    history = [{"role": "system", "content": "prompt"}] + make_turn(1) + make_turn(2)
+    assert trim_history(history, max_turns=2) is history
+
+
+def test_trim_history_cuts_at_user_boundary_and_keeps_system_prompt():
+    system = {"role": "system", "content": "prompt"}
+    history = [system] + make_turn(1) + make_turn(2) + make_turn(3)
+
+    trimmed = trim_history(history, max_turns=2)
+
+    # The oldest turn is dropped whole, tool calls stay paired with their results
+    assert trimmed == [system] + make_turn(2) + make_turn(3)
+
+
+def test_trim_history_without_system_prompt():
+    history = make_turn(1) + make_turn(2)
+    assert trim_history(history, max_turns=1) == make_turn(2)
+
+
+def test_store_session_evicts_least_recently_used():
+    with patch.object(api_server, "MAX_SESSIONS", 2):
+        store_session("a", make_turn(1))
+        store_session("b", make_turn(1))
+        # Storing "a" again makes "b" the least recently used
+        store_session("a", make_turn(2))
+        store_session("c", make_turn(1))
+
+    assert list(api_server.sessions) == ["a", "c"]
+    assert api_server.sessions["a"] == make_turn(2)
+
+
+async def run_turn(session_id, user_message, events):
+    """Run one /chat turn against a fake completion and return the decoded events."""
+    async def mock_stream_chat_completion(**kwargs):
+        for event in events(kwargs["messages"]):
+            yield event
+
+    with patch.object(api_server, "server_streams", [(None, None)]), \
+            patch("mcpcli.api_server.stream_chat_completion", new=mock_stream_chat_completion):
+        response = await chat(ChatRequest(session_id=session_id, user_message=user_message))
+        body = [frame async for frame in response.body_iterator]
+
+    return [orjson.loads(frame.removeprefix(b"data: ")) for frame in body]
+
+
+@pytest.mark.asyncio
+async def test_chat_stores_completed_turn():
+    def events(messages):
+        yield {"delta": "hi"}
+        yield {"messages": messages + [{"role": "assistant", "content": "hi"}]}
+
+    result = await run_turn("s1", "hello", events)
+
+    assert result == [{"delta": "hi"}, {"message": {"role": "assistant", "content": "hi"}}]
+    assert api_server.sessions["s1"] == [
+        {"role": "user", "content": "hello"},
+        {"role": "assistant", "content": "hi"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_chat_error_leaves_history_unchanged():
+    store_session("s1", make_turn(1))
+
+    def events(messages):
+        yield {"delta": "partial"}
+        yield {"error": "provider unavailable"}
+
+    result = await run_turn("s1", "hello again", events)
+
+    assert result[-1] == {"error": "provider unavailable"}
+    assert api_server.sessions["s1"] == make_turn(1)
@@ -0,0 +1,76 @@
+# tests/test_chat_api.py
+import pytest
+from unittest.mock import patch
+from mcpcli.chat_api import process_conversation
+
+
+class FakeClient:
+    """Stand-in for LLMClient that streams a scripted list of chunks per round."""
+
+    def __init__(self, rounds):
+        self.rounds = list(rounds)
+
+    async def stream_completion(self, messages, tools=None):
+        for chunk in self.rounds.pop(0):
+            yield chunk
+
+
+async def run_conversation(client, conversation_history, **kwargs):
+    return [token async for token in process_conversation(client, conversation_history, [], [], **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_process_conversation_streams_no_response_placeholder():
+    client = FakeClient([[{"delta": "", "tool_calls": []}]])
+    conversation_history = [{"role": "user", "content": "hi"}]
+
+    tokens = await run_conversation(client, conversation_history)
+
+    # Clients see the same text the history stores
+    assert tokens == ["No response"]
+    assert conversation_history[-1] == {"role": "assistant", "content": "No response"}
+
+
+def tool_round(*texts):
+    """A round streaming texts and ending in a tool call."""
+    tool_call = {"id": "call-1", "type": "function", "function": {"name": "lookup", "arguments": "{}"}}
+    return [{"delta": text, "tool_calls": []} for text in texts] + [{"delta": "", "tool_calls": [tool_call]}]
+
+
+def text_round(*texts):
+    return [{"delta": text, "tool_calls": []} for text in texts] + [{"delta": "", "tool_calls": []}]
+
+
+async def mock_handle_tool_calls(tool_calls, conversation_history, server_streams):
+    conversation_history.append({"role": "tool", "tool_call_id": tool_calls[0]["id"], "content": "found"})
+
+
+@pytest.mark.asyncio
+async def test_process_conversation_separates_text_across_tool_rounds():
+    client = FakeClient([tool_round("Looking", " it up"), tool_round(), text_round("Found", " it")])
+    conversation_history = [{"role": "user", "content": "find it"}]
+
+    with patch("mcpcli.chat_api.handle_tool_calls", new=mock_handle_tool_calls):
+        tokens = await run_conversation(client, conversation_history)
+
+    # A round without text adds no separator
+    assert tokens == ["Looking", " it up", "\n\n", "Found", " it"]
+    assert conversation_history[1:] == [
+        {"role": "assistant", "content": "Looking it up"},
+        {"role": "tool", "tool_call_id": "call-1", "content": "found"},
+        {"role": "tool", "tool_call_id": "call-1", "content": "found"},
+        {"role": "assistant", "content": "Found it"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_conversation_stops_after_max_iterations():
+    client = FakeClient([tool_round("Trying"), tool_round("Again")])
+    conversation_history = [{"role": "user", "content": "loop"}]
+
+    with patch("mcpcli.chat_api.handle_tool_calls", new=mock_handle_tool_calls):
+        tokens = await run_conversation(client, conversation_history, max_iterations=2)
+
+    stop_message = "Stopped after 2 rounds of tool calls."
+    assert tokens == ["Trying", "\n\n", "Again", "\n\n", stop_message]
+    assert conversation_history[-1] == {"role": "assistant", "content": stop_message}
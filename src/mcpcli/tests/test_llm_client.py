@@ -0,0 +1,66 @@
+# tests/test_llm_client.py
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from mcpcli.llm_client import LLMClient
+
+
+def make_chunk(content=None, tool_calls=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def make_fragment(index, call_id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+async def fake_stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_lite_llm_stream_stitches_tool_call_fragments():
+    chunks = [
+        make_chunk(content="Checking"),
+        make_chunk(content=" both"),
+        make_chunk(tool_calls=[make_fragment(0, "call-1", "get_weather", '{"city": ')]),
+        make_chunk(tool_calls=[make_fragment(1, "call-2", "get_time", "{}")]),
+        make_chunk(tool_calls=[make_fragment(0, arguments='"Paris"}')]),
+        # usage-only chunk sent after the last choice
+        SimpleNamespace(choices=[], usage={"total_tokens": 42}),
+    ]
+    mock_acompletion = AsyncMock(return_value=fake_stream(chunks))
+
+    with patch("mcpcli.llm_client.litellm.acompletion", new=mock_acompletion), \
+            patch("mcpcli.llm_client.get_http_client"):
+        client = LLMClient(provider="openai/gpt-4o-mini")
+        result = [chunk async for chunk in client.stream_completion(messages=[], tools=[])]
+
+    assert result[:-1] == [
+        {"delta": "Checking", "tool_calls": []},
+        {"delta": " both", "tool_calls": []},
+    ]
+    assert result[-1] == {
+        "delta": "",
+        "tool_calls": [
+            {"id": "call-1", "type": "function", "function": {"name": "get_weather", "arguments": '{"city": "Paris"}'}},
+            {"id": "call-2", "type": "function", "function": {"name": "get_time", "arguments": "{}"}},
+        ],
+    }
+    assert mock_acompletion.await_args.kwargs["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_lite_llm_stream_wraps_errors():
+    mock_acompletion = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with patch("mcpcli.llm_client.litellm.acompletion", new=mock_acompletion), \
+            patch("mcpcli.llm_client.get_http_client"):
+        client = LLMClient(provider="openai/gpt-4o-mini")
+        with pytest.raises(ValueError, match="LiteLLM API Error: boom"):
+            [chunk async for chunk in client.stream_completion(messages=[], tools=[])]
@@ -0,0 +1,39 @@
+# tests/transport/test_stdio_client.py
+import sys
+import anyio
+import pytest
+from mcpcli.transport.stdio.stdio_client import stdio_client
+from mcpcli.transport.stdio.stdio_server_parameters import StdioServerParameters
+
+# Writes frames split across chunks, blank lines, a large payload and a final
+# frame with no trailing newline, flushing and pausing between chunks
+SERVER_SCRIPT = """
+import sys, time
+chunks = [
+    b'{"jsonrpc": "2.0", "id": "1", "res',
+    b'ult": {"n": 1}}\\n\\n',
+    b'\\n{"jsonrpc": "2.0", "id": "2", "result": {"big": "' + b"x" * 70000 + b'"}}\\n',
+    b'{"jsonrpc": "2.0", "id": "3", "result": {"n": 3}}',
+]
+for chunk in chunks:
+    sys.stdout.buffer.write(chunk)
+    sys.stdout.buffer.flush()
+    time.sleep(0.05)
+"""
+
+
+@pytest.mark.asyncio
+async def test_stdout_reader_reassembles_frames():
+    server = StdioServerParameters(command=sys.executable, args=["-c", SERVER_SCRIPT])
+    messages = []
+
+    async with stdio_client(server) as (read_stream, write_stream):
+        with anyio.fail_after(10):
+            async for message in read_stream:
+                messages.append(message)
+        await write_stream.aclose()
+
+    assert [message.id for message in messages] == ["1", "2", "3"]
+    assert messages[0].result == {"n": 1}
+    assert messages[1].result == {"big": "x" * 70000}
+    assert messages[2].result == {"n": 3}
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import re
@@ -28,8 +29,9 @@ def parse_tool_response(response: str) -> Optional[Dict[str, Any]]:
 async def handle_tool_call(tool_call, conversation_history, server_streams):
     """
     Handle a single tool call for both OpenAI and Llama formats.
-    This function no longer prints directly to stdout. It updates the conversation_history
-    with the tool call and its response. The calling function can then display the results.
+    This function does not print or modify conversation_history. It returns the messages
+    recording the tool call and its response (empty if the call could not be handled), so
+    callers can run several tool calls concurrently and append the results in order.
     """
     tool_call_id = None
     tool_name = "unknown_tool"
@@ -55,7 +57,7 @@ async def handle_tool_call(tool_call, conversation_history, server_streams):
             parsed_tool = parse_tool_response(last_message)
             if not parsed_tool:
                 logging.debug("Unable to parse tool call from message")
-                return
+                return []
 
             tool_call_id = parsed_tool["id"]
             tool_name = parsed_tool["function"]
@@ -84,9 +86,8 @@ async def handle_tool_call(tool_call, conversation_history, server_streams):
         formatted_response = format_tool_response(tool_response.get("content", []))
         logging.debug(f"Tool '{tool_name}' Response: {formatted_response}")
 
-        # Update the conversation history with the tool call
-        # Add the tool call itself (for OpenAI tracking)
-        conversation_history.append(
+        # Record the tool call itself (for OpenAI tracking) and its response
+        return [
             {
                 "role": "assistant",
                 "content": None,
@@ -102,18 +103,14 @@ async def handle_tool_call(tool_call, conversation_history, server_streams):
                         },
                     }
                 ],
-            }
-        )
-
-        # Add the tool response to conversation history
-        conversation_history.append(
+            },
             {
                 "role": "tool",
                 "name": tool_name,
                 "content": formatted_response,
                 "tool_call_id": tool_call_id,
-            }
-        )
+            },
+        ]
 
     except json.JSONDecodeError:
         logging.debug(
@@ -121,6 +118,23 @@ async def handle_tool_call(tool_call, conversation_history, server_streams):
         )
     except Exception as e:
         logging.debug(f"Error handling tool call '{tool_name}': {str(e)}")
+    return []
+
+
+async def handle_tool_calls(tool_calls, conversation_history, server_streams):
+    """
+    Handle a batch of tool calls concurrently.
+    The resulting messages are appended to conversation_history in the order the
+    tool calls were made, regardless of which call finishes first.
+    """
+    results = await asyncio.gather(
+        *(
+            handle_tool_call(tool_call, conversation_history, server_streams)
+            for tool_call in tool_calls
+        )
+    )
+    for messages in results:
+        conversation_history.extend(messages)
 
 
 def format_tool_response(response_content):
@@ -1,18 +1,23 @@
 # transport/stdio/stdio_client.py
-import json
 import logging
 import sys
 import traceback
 from contextlib import asynccontextmanager
 
 import anyio
-from anyio.streams.text import TextReceiveStream
+import orjson
+import pydantic_core
 
 from mcpcli.environment import get_default_environment
 from mcpcli.messages.message_types.json_rpc_message import JSONRPCMessage
 from mcpcli.transport.stdio.stdio_server_parameters import StdioServerParameters
 
 
+def _decode(line: memoryview) -> str:
+    """Render a raw line from the server for logging."""
+    return bytes(line).decode(errors="replace").strip()
+
+
 @asynccontextmanager
 async def stdio_client(server: StdioServerParameters):
     # ensure we have a server command
@@ -40,43 +45,54 @@ async def stdio_client(server: StdioServerParameters):
     )
 
     # create a task to read from the subprocess' stdout
-    async def process_json_line(line: str, writer):
+    async def process_json_line(line: memoryview, writer):
+        # only render messages for the log when someone will read them
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
         try:
-            logging.debug(f"Processing line: {line.strip()}")
-            data = json.loads(line)
+            if debug:
+                logging.debug(f"Processing line: {_decode(line)}")
 
-            # parse the json
-            logging.debug(f"Parsed JSON data: {data}")
+            # parse the json straight from the read buffer
+            data = orjson.loads(line)
+            if debug:
+                logging.debug(f"Parsed JSON data: {data}")
 
             # validate the jsonrpc message
             message = JSONRPCMessage.model_validate(data)
-            logging.debug(f"Validated JSONRPCMessage: {message}")
+            if debug:
+                logging.debug(f"Validated JSONRPCMessage: {message}")
 
             # send the message
             await writer.send(message)
-        except json.JSONDecodeError as exc:
+        except orjson.JSONDecodeError as exc:
             # not valid json
-            logging.error(f"JSON decode error: {exc}. Line: {line.strip()}")
+            logging.error(f"JSON decode error: {exc}. Line: {_decode(line)}")
         except Exception as exc:
             # other exception
-            logging.error(f"Error processing message: {exc}. Line: {line.strip()}")
+            logging.error(f"Error processing message: {exc}. Line: {_decode(line)}")
             logging.debug(f"Traceback:\n{traceback.format_exc()}")
 
     async def stdout_reader():
         """Read JSON-RPC messages from the server's stdout."""
         assert process.stdout, "Opened process is missing stdout"
-        buffer = ""
+        buffer = bytearray()
         logging.debug("Starting stdout_reader")
         try:
             async with read_stream_writer:
-                async for chunk in TextReceiveStream(process.stdout):
-                    lines = (buffer + chunk).split("\n")
-                    buffer = lines.pop()
-                    for line in lines:
-                        if line.strip():
-                            await process_json_line(line, read_stream_writer)
+                async for chunk in process.stdout:
+                    buffer += chunk
+                    start = 0
+                    while (end := buffer.find(b"\n", start)) != -1:
+                        if end > start:
+                            # hand the line over as a view, it must be released
+                            # before the buffer is resized below
+                            with memoryview(buffer)[start:end] as line:
+                                await process_json_line(line, read_stream_writer)
+                        start = end + 1
+                    del buffer[:start]
                 if buffer.strip():
-                    await process_json_line(buffer, read_stream_writer)
+                    with memoryview(buffer) as line:
+                        await process_json_line(line, read_stream_writer)
         except anyio.ClosedResourceError:
             logging.debug("Read stream closed.")
         except Exception as exc:
@@ -93,9 +109,10 @@ async def stdio_client(server: StdioServerParameters):
         try:
             async with write_stream_reader:
                 async for message in write_stream_reader:
-                    json_str = message.model_dump_json(exclude_none=True)
-                    logging.debug(f"Sending: {json_str}")
-                    await process.stdin.send((json_str + "\n").encode())
+                    json_bytes = pydantic_core.to_json(message, by_alias=False, exclude_none=True)
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(f"Sending: {json_bytes.decode()}")
+                    await process.stdin.send(json_bytes + b"\n")
         except anyio.ClosedResourceError:
             logging.debug("Write stream closed.")
         except Exception as exc: